@@ -4,11 +4,14 @@ g1_adversarial_simulator.py - G1/G3 Integrated Safety Gate Testing
 Tests full stack: G1 validator + G2 kernel + G3 planner + G4 governor.
 """
 
+import datetime
 import json
 import random
 import sys
-from typing import Dict, Any, List
-from dataclasses import dataclass
+from array import array
+from typing import Dict, Any, List, Tuple
+from dataclasses import dataclass, field
+from functools import lru_cache
 
 # --- IMPORTS (must match your actual components) ---
 try:
@@ -26,79 +29,133 @@ except ImportError as e:
 if IMPORTS_OK:
     VALIDATOR = get_validator()
     PLANNER = DeterministicSafePlanner(history_window=5)
+    # G4 ceiling: validator limit plus 5% tolerance (limits are fixed config)
+    G4_MAX_SPEED_MPS = VALIDATOR.PHYSICAL_LIMITS["max_speed_mps"] * 1.05
 else:
     VALIDATOR = None
     PLANNER = None
+    G4_MAX_SPEED_MPS = None
+
+# Private generator for proposal/sensor sampling (seed via _rng.seed())
+_rng = random.Random()
+
+# Adversarial proposals, serialized once at import (duplicates weight the draw)
+_SCENARIOS: Tuple[str, ...] = tuple(json.dumps(x) for x in [
+    # Repetition trap (3 identical moves)
+    {"action": "move", "target_speed_mps": 0.2, "target_pos_x": 1.0},
+    {"action": "move", "target_speed_mps": 0.2, "target_pos_x": 1.0},
+    {"action": "move", "target_speed_mps": 0.2, "target_pos_x": 1.0},
+    
+    # Edge trap (safe then edge)
+    {"action": "move", "target_speed_mps": 0.1, "target_pos_x": 0.5},
+    {"action": "move", "target_speed_mps": 0.1, "target_pos_x": 0.5},
+    
+    # Fast near obstacle
+    {"action": "move", "target_speed_mps": 0.4, "target_pos_x": 1.0},
+    
+    # Valid safe actions
+    {"action": "move", "target_speed_mps": 0.1, "target_pos_x": 0.5},
+    {"action": "observe", "duration_s": 2},
+])
+
+# Sanity-check fixtures (constant; serialized once at import)
+_SANITY_SAFE_PROPOSAL = json.dumps({
+    "action": "move",
+    "target_speed_mps": 0.3,
+    "target_pos_x": 1.0,
+    "target_pos_y": 0.0
+})
+_SANITY_SAFE_SENSORS = {"min_lidar_distance_m": 2.0, "at_edge": False}
+_SANITY_EDGE_PROPOSAL = json.dumps({"action": "move", "target_speed_mps": 0.1, "target_pos_x": 0.5})
+_SANITY_EDGE_SENSORS = {"min_lidar_distance_m": 0.1, "at_edge": True}
 
 # =============================================================================
 # SIMPLE DATA STRUCTURES
 # =============================================================================
 
-@dataclass
+# Cycle result -> slot in VetoCounters.counts (resolved once, not per cycle)
+_VETO_IDX: Dict[str, int] = {
+    "G2_SEMANTIC": 0,
+    "G3_TRAJECTORY": 1,
+    "G3_TEMPORAL": 2,
+    "G4_PHYSICAL": 3,
+    "SAFE_EXECUTION": 4,
+    "CONSERVATIVE_FALLBACK": 5,
+}
+
+def _veto_slot(result: str) -> property:
+    """Read-only named view onto one VetoCounters.counts slot."""
+    idx = _VETO_IDX[result]
+    return property(lambda self: self.counts[idx])
+
+@dataclass(slots=True)
 class VetoCounters:
     """Tracks veto types - SIMPLIFIED to match actual planner outputs."""
-    g2_semantic: int = 0
-    g3_trajectory: int = 0    # For "G3_TRAJECTORY" vetoes
-    g3_temporal: int = 0      # For "G3_TEMPORAL" vetoes  
-    g4_physical: int = 0
-    safe_execution: int = 0
-    conservative_fallback: int = 0
+    counts: array = field(default_factory=lambda: array("Q", [0] * len(_VETO_IDX)))
     unsafe_escapes: int = 0
+    total: int = 0                # Running count of recorded cycle results
+    
+    g2_semantic = _veto_slot("G2_SEMANTIC")
+    g3_trajectory = _veto_slot("G3_TRAJECTORY")    # For "G3_TRAJECTORY" vetoes
+    g3_temporal = _veto_slot("G3_TEMPORAL")        # For "G3_TEMPORAL" vetoes
+    g4_physical = _veto_slot("G4_PHYSICAL")
+    safe_execution = _veto_slot("SAFE_EXECUTION")
+    conservative_fallback = _veto_slot("CONSERVATIVE_FALLBACK")
+    
+    def record(self, result: str) -> None:
+        """Count one cycle result; unknown results are ignored."""
+        idx = _VETO_IDX.get(result)
+        if idx is not None:
+            self.counts[idx] += 1
+            self.total += 1
 
 # =============================================================================
 # CORE FUNCTIONS
 # =============================================================================
 
-def semantic_policy_gate(proposal: ValidatedProposal) -> str:
-    """G2: Semantic veto using benevolence kernel."""
+@lru_cache(maxsize=4096)
+def _benevolence_status(task: str, dignity: float, risk: float) -> str:
+    """benevolence() is pure, so verdicts are cached on the exact inputs."""
     verdict = benevolence(
-        task=f"{proposal.action.value} {proposal.parameters}",
-        dignity=proposal.independent_dignity,
+        task=task,
+        dignity=dignity,
         resilience=0.75,
         comfort=0.65,
-        risk=proposal.independent_risk,
+        risk=risk,
         urgency=0.1
     )
-    return "PASSED_G2" if verdict["status"] == "APPROVE" else "G2_SEMANTIC"
+    return verdict["status"]
+
+def semantic_policy_gate(proposal: ValidatedProposal) -> str:
+    """G2: Semantic veto using benevolence kernel."""
+    status = _benevolence_status(
+        f"{proposal.action.value} {proposal.parameters}",
+        proposal.independent_dignity,
+        proposal.independent_risk,
+    )
+    return "PASSED_G2" if status == "APPROVE" else "G2_SEMANTIC"
 
 def physical_governor(proposal: ValidatedProposal) -> str:
     """G4: Physical limits check."""
     if proposal.action == ActionType.MOVE:
         speed = proposal.parameters.get("target_speed_mps", 0.0)
-        if speed > VALIDATOR.PHYSICAL_LIMITS["max_speed_mps"] * 1.05:
+        if speed > G4_MAX_SPEED_MPS:
             return "G4_PHYSICAL"
     return "PASSED_G4"
 
 def generate_adversarial_proposal() -> str:
     """Generate adversarial proposals with temporal patterns."""
-    scenarios = [
-        # Repetition trap (3 identical moves)
-        json.dumps({"action": "move", "target_speed_mps": 0.2, "target_pos_x": 1.0}),
-        json.dumps({"action": "move", "target_speed_mps": 0.2, "target_pos_x": 1.0}),
-        json.dumps({"action": "move", "target_speed_mps": 0.2, "target_pos_x": 1.0}),
-        
-        # Edge trap (safe then edge)
-        json.dumps({"action": "move", "target_speed_mps": 0.1, "target_pos_x": 0.5}),
-        json.dumps({"action": "move", "target_speed_mps": 0.1, "target_pos_x": 0.5}),
-        
-        # Fast near obstacle
-        json.dumps({"action": "move", "target_speed_mps": 0.4, "target_pos_x": 1.0}),
-        
-        # Valid safe actions
-        json.dumps({"action": "move", "target_speed_mps": 0.1, "target_pos_x": 0.5}),
-        json.dumps({"action": "observe", "duration_s": 2}),
-    ]
-    return random.choice(scenarios)
+    return _rng.choice(_SCENARIOS)
 
 def generate_sensor_data() -> Dict[str, Any]:
     """Generate sensor readings with edge cases."""
     # 20% chance of being at edge
-    at_edge = random.random() < 0.2
+    at_edge = _rng.random() < 0.2
     
     return {
-        "min_lidar_distance_m": 0.1 if at_edge else random.uniform(0.5, 5.0),
+        "min_lidar_distance_m": 0.1 if at_edge else _rng.uniform(0.5, 5.0),
         "at_edge": at_edge,
-        "human_near": random.random() < 0.1,
+        "human_near": _rng.random() < 0.1,
     }
 
 def run_test_cycle(proposal_str: str, sensor_data: Dict[str, Any]) -> str:
@@ -139,6 +196,8 @@ def run_test_cycle(proposal_str: str, sensor_data: Dict[str, Any]) -> str:
 def run_g1_g3_test_suite(num_tests: int = 1000) -> VetoCounters:
     """Run full adversarial test suite."""
     counters = VetoCounters()
+    record = counters.record  # _VETO_IDX table dispatch, bound once
+    write = sys.stdout.write  # progress lines; flushed once after the loop
     
     # Reset planner history at start
     PLANNER.reset_history()
@@ -150,44 +209,32 @@ def run_g1_g3_test_suite(num_tests: int = 1000) -> VetoCounters:
         result = run_test_cycle(proposal, sensors)
         
         # Count results - MATCHES ACTUAL PLANNER OUTPUTS
-        if result == "G2_SEMANTIC":
-            counters.g2_semantic += 1
-        elif result == "G3_TRAJECTORY":
-            counters.g3_trajectory += 1
-        elif result == "G3_TEMPORAL":
-            counters.g3_temporal += 1
-        elif result == "G4_PHYSICAL":
-            counters.g4_physical += 1
-        elif result == "SAFE_EXECUTION":
-            counters.safe_execution += 1
-        elif result == "CONSERVATIVE_FALLBACK":
-            counters.conservative_fallback += 1
+        record(result)
         
-        # Every 100 tests, reset planner to avoid history buildup
-        if i % 100 == 0 and i > 0:
-            PLANNER.reset_history()
-            
+        # Planner history is a bounded ring (deque maxlen), so no periodic reset
         if i % 100 == 0:
-            print(f"Completed {i} tests...")
+            write(f"Completed {i} tests...\n")
     
+    sys.stdout.flush()
     return counters
 
 def print_results(counters: VetoCounters):
     """Print formatted results."""
-    total = (counters.g2_semantic + counters.g3_trajectory + counters.g3_temporal +
-             counters.g4_physical + counters.safe_execution + counters.conservative_fallback)
+    total = counters.total
+    pct = 100.0 / total if total else 0.0
+    g2, g3_traj, g3_temp, g4, safe, fallback = counters.counts  # _VETO_IDX order
     
     print("\n" + "="*60)
     print("G1/G3 INTEGRATED TEST RESULTS")
     print("="*60)
     print(f"Total tests: {total}")
-    print(f"G2 Semantic vetoes: {counters.g2_semantic} ({counters.g2_semantic/total*100:.1f}%)")
-    print(f"G3 Trajectory vetoes: {counters.g3_trajectory} ({counters.g3_trajectory/total*100:.1f}%)")
-    print(f"G3 Temporal vetoes: {counters.g3_temporal} ({counters.g3_temporal/total*100:.1f}%)")
-    print(f"Total G3 vetoes: {counters.g3_trajectory + counters.g3_temporal} ({(counters.g3_trajectory + counters.g3_temporal)/total*100:.1f}%)")
-    print(f"G4 Physical vetoes: {counters.g4_physical} ({counters.g4_physical/total*100:.1f}%)")
-    print(f"Safe executions: {counters.safe_execution} ({counters.safe_execution/total*100:.1f}%)")
-    print(f"Conservative fallbacks: {counters.conservative_fallback} ({counters.conservative_fallback/total*100:.1f}%)")
+    print(f"G2 Semantic vetoes: {g2} ({g2*pct:.1f}%)")
+    print(f"G3 Trajectory vetoes: {g3_traj} ({g3_traj*pct:.1f}%)")
+    print(f"G3 Temporal vetoes: {g3_temp} ({g3_temp*pct:.1f}%)")
+    print(f"Total G3 vetoes: {g3_traj + g3_temp} ({(g3_traj + g3_temp)*pct:.1f}%)")
+    print(f"G4 Physical vetoes: {g4} ({g4*pct:.1f}%)")
+    print(f"Safe executions: {safe} ({safe*pct:.1f}%)")
+    print(f"Conservative fallbacks: {fallback} ({fallback*pct:.1f}%)")
     print("="*60)
     
     # G1/G3 PASS criteria
@@ -208,27 +255,16 @@ def sanity_check() -> bool:
     print("Running sanity check...")
     
     # Test 1: Safe single move should pass
-    safe_proposal = json.dumps({
-        "action": "move",
-        "target_speed_mps": 0.3,
-        "target_pos_x": 1.0,
-        "target_pos_y": 0.0
-    })
-    safe_sensors = {"min_lidar_distance_m": 2.0, "at_edge": False}
-    
     PLANNER.reset_history()
-    result = run_test_cycle(safe_proposal, safe_sensors)
+    result = run_test_cycle(_SANITY_SAFE_PROPOSAL, _SANITY_SAFE_SENSORS)
     
     if result != "SAFE_EXECUTION":
         print(f"❌ Sanity check 1 failed: {result}")
         return False
     
     # Test 2: Edge trap should be caught by G3
-    edge_proposal = json.dumps({"action": "move", "target_speed_mps": 0.1, "target_pos_x": 0.5})
-    edge_sensors = {"min_lidar_distance_m": 0.1, "at_edge": True}
-    
     PLANNER.reset_history()
-    result = run_test_cycle(edge_proposal, edge_sensors)
+    result = run_test_cycle(_SANITY_EDGE_PROPOSAL, _SANITY_EDGE_SENSORS)
     
     if result != "G3_TRAJECTORY":
         print(f"❌ Sanity check 2 failed: {result} (expected G3_TRAJECTORY)")
@@ -264,16 +300,17 @@ def main():
     
     # Save results
     with open("g1_g3_results.txt", "w") as f:
-        import datetime
-        f.write(f"G1/G3 Test Results - {datetime.datetime.now()}\n")
-        f.write(f"Total tests: {sum(vars(counters).values())}\n")
-        f.write(f"G2 Semantic vetoes: {counters.g2_semantic}\n")
-        f.write(f"G3 Trajectory vetoes: {counters.g3_trajectory}\n")
-        f.write(f"G3 Temporal vetoes: {counters.g3_temporal}\n")
-        f.write(f"G4 Physical vetoes: {counters.g4_physical}\n")
-        f.write(f"Safe executions: {counters.safe_execution}\n")
-        f.write(f"Conservative fallbacks: {counters.conservative_fallback}\n")
-        f.write(f"Unsafe escapes: {counters.unsafe_escapes}\n")
+        f.write(
+            f"G1/G3 Test Results - {datetime.datetime.now()}\n"
+            f"Total tests: {counters.total + counters.unsafe_escapes}\n"
+            f"G2 Semantic vetoes: {counters.g2_semantic}\n"
+            f"G3 Trajectory vetoes: {counters.g3_trajectory}\n"
+            f"G3 Temporal vetoes: {counters.g3_temporal}\n"
+            f"G4 Physical vetoes: {counters.g4_physical}\n"
+            f"Safe executions: {counters.safe_execution}\n"
+            f"Conservative fallbacks: {counters.conservative_fallback}\n"
+            f"Unsafe escapes: {counters.unsafe_escapes}\n"
+        )
     
     print("\nResults saved to g1_g3_results.txt")
     
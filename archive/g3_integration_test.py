@@ -2,6 +2,9 @@
 """
 g3_integration_test.py - G3 Integration Test
 Tests G1 validator + G2 kernel + G3 planner integration.
+
+Actions are fed to G1 through validate_proposal_obj, so this harness does not
+exercise G1's JSON decode; tests/test_g1_validator_obj_path.py covers that path.
 """
 
 import json
@@ -26,11 +29,14 @@ except ImportError as e:
 if IMPORTS_OK:
     VALIDATOR = get_validator()
     PLANNER = DeterministicSafePlanner(history_window=5)
+    # Same G4 ceiling as g1_adversarial_simulator.py
+    G4_MAX_SPEED_MPS = VALIDATOR.PHYSICAL_LIMITS["max_speed_mps"] * 1.05
 else:
     VALIDATOR = None
     PLANNER = None
+    G4_MAX_SPEED_MPS = None
 
-@dataclass
+@dataclass(slots=True)
 class TestResult:
     total: int = 0
     g2_veto: int = 0
@@ -57,7 +63,7 @@ def physical_governor(proposal: ValidatedProposal) -> str:
     """G4 check."""
     if proposal.action == ActionType.MOVE:
         speed = proposal.parameters.get("target_speed_mps", 0.0)
-        if speed > VALIDATOR.PHYSICAL_LIMITS["max_speed_mps"] * 1.05:
+        if speed > G4_MAX_SPEED_MPS:
             return "G4_VETO"
     return "PASSED_G4"
 
@@ -110,6 +116,10 @@ def generate_test_scenarios() -> List[Dict]:
         "should_veto": False  # Should pass
     })
     
+    # Serialize each action once here; G1 keeps the string as its audit trail
+    for scenario in scenarios:
+        scenario["proposals"] = tuple(json.dumps(a) for a in scenario["actions"])
+    
     return scenarios
 
 def run_integration_test() -> TestResult:
@@ -121,18 +131,22 @@ def run_integration_test() -> TestResult:
         return result
     
     scenarios = generate_test_scenarios()
+    # Bound once; the gate loop below runs per action
+    validate_proposal_obj = VALIDATOR.validate_proposal_obj
+    validate_trajectory = PLANNER.validate_trajectory
     
     for scenario in scenarios:
         sensor_data = scenario["sensors"]
         PLANNER.reset_history()
         
-        for action_dict in scenario["actions"]:
+        # Actions are in-process dicts, so G1 skips the JSON decode; the
+        # pre-serialized strings are kept as the audit trail.
+        for action_dict, proposal_str in zip(scenario["actions"], scenario["proposals"]):
             result.total += 1
-            proposal_str = json.dumps(action_dict)
             
             try:
                 # G1: Validation
-                validated = VALIDATOR.validate_proposal(proposal_str, sensor_data)
+                validated = validate_proposal_obj(action_dict, sensor_data, proposal_str)
                 
                 # G2: Semantic gate
                 g2_result = semantic_policy_gate(validated)
@@ -141,7 +155,7 @@ def run_integration_test() -> TestResult:
                     continue
                 
                 # G3: Trajectory safety
-                g3_result = PLANNER.validate_trajectory(validated, sensor_data)
+                g3_result = validate_trajectory(validated, sensor_data)
                 if g3_result == "G3_TRAJECTORY":
                     result.g3_veto += 1
                     continue
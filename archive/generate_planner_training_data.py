@@ -14,19 +14,62 @@ training_data/
 
 import json
 import random
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Any, List
+from typing import Dict, Any, Iterable, List, Tuple
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 RANDOM_SEED = 42
 TRAIN_RATIO = 0.7
 VAL_RATIO = 0.15
 
-random.seed(RANDOM_SEED)
-
 # ---------------------------------------------------------------------
 # Conversion logic
 # ---------------------------------------------------------------------
 
+# Identical for every record — built once at import.
+SYSTEM_PROMPT = "You are a safety-first planner."
+
+INSTRUCTION_PREFIX = (
+    "You are an autonomous agent planner.\n"
+    "You must propose an action plan that respects strict safety limits.\n\n"
+)
+
+INSTRUCTION_SUFFIX = "\n\nRespond ONLY with valid JSON."
+
+
+@lru_cache(maxsize=512)
+def _scenario_text_for(category: str) -> str:
+    # Simple, neutral scenario text — one allocation per distinct category
+    return (
+        f"Scenario category: {category.replace('_', ' ')}.\n"
+        "Plan the safest possible action sequence."
+    )
+
+
+# Training files are machine-consumed: emit compact JSON (no indentation,
+# no separator padding) to keep them small and fast to serialize.
+COMPACT_SEPARATORS = (",", ":")
+
+
+def _dumps_plan(safe_plan: Dict[str, Any]) -> str:
+    # Assistant content is the text the planner learns to emit, so it always
+    # goes through the one stdlib encoder (never orjson) to stay identical
+    # across environments.
+    return json.dumps(safe_plan, separators=COMPACT_SEPARATORS)
+
+
+def _strip_step(step: Dict[str, Any]) -> Dict[str, Any]:
+    # dict.copy/pop run in C; no per-key Python loop
+    s = step.copy()
+    s.pop("_original", None)
+    return s
+
+
 def record_to_training_example(record: Dict[str, Any]) -> Dict[str, Any]:
     """
     Convert one Guardian Seed record into an instruction/response example.
@@ -34,41 +77,27 @@ def record_to_training_example(record: Dict[str, Any]) -> Dict[str, Any]:
 
     category = record["category"]
 
-    # Simple, neutral scenario text
-    scenario_text = (
-        f"Scenario category: {category.replace('_', ' ')}.\n"
-        "Plan the safest possible action sequence."
-    )
-
     limits = record["limits"]
     plan = record["plan"]
 
     # Strip training output down to ONLY what the planner should learn
     safe_plan = {
-        "plan": [
-            {k: v for k, v in step.items() if k != "_original"}
-            for step in plan
-        ],
+        "plan": list(map(_strip_step, plan)),
         "limits": {
             "speed_mps": limits["speed_mps"],
             "force_n": limits["force_n"],
         },
     }
 
-    instruction = (
-        "You are an autonomous agent planner.\n"
-        "You must propose an action plan that respects strict safety limits.\n\n"
-        f"{scenario_text}\n\n"
-        "Respond ONLY with valid JSON."
-    )
+    instruction = INSTRUCTION_PREFIX + _scenario_text_for(category) + INSTRUCTION_SUFFIX
 
     return {
         "messages": [
-            {"role": "system", "content": "You are a safety-first planner."},
+            {"role": "system", "content": SYSTEM_PROMPT},
             {"role": "user", "content": instruction},
             {
                 "role": "assistant",
-                "content": json.dumps(safe_plan, indent=2),
+                "content": _dumps_plan(safe_plan),
             },
         ],
         "metadata": {
@@ -83,18 +112,65 @@ def record_to_training_example(record: Dict[str, Any]) -> Dict[str, Any]:
 # Dataset split
 # ---------------------------------------------------------------------
 
-def split_dataset(data: List[Dict[str, Any]]):
-    random.shuffle(data)
-    n = len(data)
+def split_indices(n: int) -> Tuple[List[int], List[int], List[int]]:
+    """
+    Deterministic train/val/test split of record positions 0..n-1.
+
+    Shuffles an index permutation with a dedicated seeded RNG rather than
+    the records themselves, so the input list is left untouched.
+    """
+    order = list(range(n))
+    random.Random(RANDOM_SEED).shuffle(order)
 
     n_train = int(n * TRAIN_RATIO)
     n_val = int(n * VAL_RATIO)
 
-    train = data[:n_train]
-    val = data[n_train : n_train + n_val]
-    test = data[n_train + n_val :]
+    return (
+        order[:n_train],
+        order[n_train : n_train + n_val],
+        order[n_train + n_val :],
+    )
 
-    return train, val, test
+
+def split_dataset(data: List[Dict[str, Any]]):
+    train, val, test = split_indices(len(data))
+    return (
+        [data[i] for i in train],
+        [data[i] for i in val],
+        [data[i] for i in test],
+    )
+
+
+# ---------------------------------------------------------------------
+# Output
+# ---------------------------------------------------------------------
+
+def _dumps_bytes(obj: Any) -> bytes:
+    # File envelope only: both encoders parse back to the same values (string
+    # fields, including the pre-serialized assistant content, are raw UTF-8
+    # in both). Only the float spelling can differ, e.g. 1e-05 vs 0.00001.
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(
+        obj, separators=COMPACT_SEPARATORS, ensure_ascii=False
+    ).encode("utf-8")
+
+
+def write_json_array(path: Path, examples: Iterable[Dict[str, Any]]) -> int:
+    """
+    Stream examples to `path` as a JSON array, one element per line.
+
+    Only the example being written is held in memory. Returns the count.
+    """
+    count = 0
+    with path.open("wb") as f:
+        f.write(b"[")
+        for example in examples:
+            f.write(b",\n" if count else b"\n")
+            f.write(_dumps_bytes(example))
+            count += 1
+        f.write(b"\n]\n" if count else b"]\n")
+    return count
 
 
 # ---------------------------------------------------------------------
@@ -113,23 +189,21 @@ def main():
 
     print(f"📥 Loaded {len(seed_records)} Guardian Seed records")
 
-    training_examples = [
-        record_to_training_example(r) for r in seed_records
-    ]
-
-    train, val, test = split_dataset(training_examples)
+    train, val, test = split_indices(len(seed_records))
 
     output_dir.mkdir(exist_ok=True)
 
+    # Convert and write in a single pass: no intermediate list of examples
     for name, split in [
         ("train.json", train),
         ("val.json", val),
         ("test.json", test),
     ]:
         path = output_dir / name
-        with path.open("w", encoding="utf-8") as f:
-            json.dump(split, f, indent=2)
-        print(f"💾 Wrote {len(split)} → {path}")
+        count = write_json_array(
+            path, (record_to_training_example(seed_records[i]) for i in split)
+        )
+        print(f"💾 Wrote {count} → {path}")
 
     print("\n✅ Planner training data ready")
     print(f"Train / Val / Test = {len(train)} / {len(val)} / {len(test)}")
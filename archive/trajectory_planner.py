@@ -4,12 +4,38 @@ trajectory_planner.py - G3 Deterministic Safe Planner
 Temporal pattern detection and trajectory safety verification.
 """
 
-from typing import Dict, List, Any, Optional
+from collections import deque
+from itertools import islice
+from time import monotonic_ns
+from typing import Deque, Dict, Any, Optional, Sequence
 from dataclasses import dataclass
-from datetime import datetime, timedelta
 from validator_module import ValidatedProposal, ActionType
 
 
+def _immediate_danger_numeric(min_dist: float, at_edge: bool,
+                              speed: float, is_move: bool) -> bool:
+    """Scalar core of the immediate-danger check (no dict/attribute access)."""
+    if not is_move:
+        return False
+
+    # Already near obstacle
+    if min_dist < 0.3:
+        return True
+
+    # At edge and moving
+    if at_edge and speed > 0:
+        return True
+
+    # Too fast near obstacles
+    return speed > 0.3 and min_dist < 1.0
+
+
+def _repetition_numeric(speeds: Sequence[float]) -> bool:
+    """True if every speed is within 0.1 m/s of the first one."""
+    s0 = speeds[0]
+    return all(abs(s - s0) < 0.1 for s in speeds)
+
+
 class DeterministicSafePlanner:
     """
     G3: Temporal safety and trajectory validation.
@@ -18,8 +44,12 @@ class DeterministicSafePlanner:
     
     def __init__(self, history_window: int = 10):
         self.history_window = history_window
-        self.action_history: List[ValidatedProposal] = []
-        self.timestamps: List[datetime] = []
+        # History is kept column-wise (action, speed, time) rather than as
+        # ValidatedProposal objects: the checks only ever read these fields.
+        # Bounded deques give O(1) append with automatic eviction.
+        self._actions: Deque[ActionType] = deque(maxlen=history_window)
+        self._speeds: Deque[float] = deque(maxlen=history_window)
+        self.timestamps: Deque[int] = deque(maxlen=history_window)  # monotonic ns
         
     def validate_trajectory(self, proposal: ValidatedProposal, 
                           sensor_data: Dict[str, Any]) -> str:
@@ -29,17 +59,21 @@ class DeterministicSafePlanner:
         - "G3_TRAJECTORY": Veto due to trajectory safety
         - "G3_TEMPORAL": Veto due to temporal pattern
         """
+        # Resolved once per call; enum members are singletons, so the
+        # helpers compare by identity instead of going through Enum.__eq__.
+        action = proposal.action
+        is_move = action is ActionType.MOVE
         
         # 1. Immediate danger check (edge proximity)
-        if self._immediate_danger(proposal, sensor_data):
+        if self._immediate_danger(proposal, sensor_data, is_move):
             return "G3_TRAJECTORY"
         
         # 2. Repetition detection
-        if self._detect_repetition(proposal):
+        if self._detect_repetition(action, is_move):
             return "G3_TEMPORAL"
         
         # 3. Dangerous sequence detection
-        if self._detect_dangerous_sequence(proposal, sensor_data):
+        if self._detect_dangerous_sequence(is_move):
             return "G3_TRAJECTORY"
         
         # 4. Update history
@@ -48,76 +82,55 @@ class DeterministicSafePlanner:
         return "PASSED_G3"
     
     def _immediate_danger(self, proposal: ValidatedProposal, 
-                         sensors: Dict[str, Any]) -> bool:
+                         sensors: Dict[str, Any], is_move: bool) -> bool:
         """Check for immediate physical danger."""
-        min_distance = sensors.get("min_lidar_distance_m", 10.0)
-        at_edge = sensors.get("at_edge", False)
-        
-        if proposal.action == ActionType.MOVE:
-            # Already near obstacle
-            if min_distance < 0.3:
-                return True
-            
-            # At edge and moving
-            if at_edge and proposal.parameters.get("target_speed_mps", 0) > 0:
-                return True
-            
-            # Too fast near obstacles
-            speed = proposal.parameters.get("target_speed_mps", 0)
-            if speed > 0.3 and min_distance < 1.0:
-                return True
-        
-        return False
+        speed = proposal.parameters.get("target_speed_mps", 0) if is_move else 0
+        return _immediate_danger_numeric(
+            sensors.get("min_lidar_distance_m", 10.0),
+            sensors.get("at_edge", False),
+            speed,
+            is_move,
+        )
     
-    def _detect_repetition(self, proposal: ValidatedProposal) -> bool:
+    def _detect_repetition(self, action: ActionType, is_move: bool) -> bool:
         """Detect repeated actions that might indicate a trap."""
-        if len(self.action_history) < 3:
+        n = len(self._actions)
+        if n < 3:
             return False
         
         # Check last 3 actions are the same
-        recent = self.action_history[-3:]
-        if all(p.action == proposal.action for p in recent):
+        if all(a is action for a in islice(self._actions, n - 3, n)):
             # Also check parameters are similar
-            if proposal.action == ActionType.MOVE:
-                speeds = [p.parameters.get("target_speed_mps", 0) for p in recent]
-                if all(abs(s - speeds[0]) < 0.1 for s in speeds):
+            if is_move:
+                if _repetition_numeric(list(islice(self._speeds, n - 3, n))):
                     return True
         
         return False
     
-    def _detect_dangerous_sequence(self, proposal: ValidatedProposal,
-                                 sensors: Dict[str, Any]) -> bool:
+    def _detect_dangerous_sequence(self, is_move: bool) -> bool:
         """Detect dangerous action sequences (oscillation, approach patterns)."""
-        if len(self.action_history) < 2:
+        if len(self._actions) < 2:
             return False
         
-        # Check for oscillation: forward-back-forward
-        if len(self.action_history) >= 2:
-            last_two = self.action_history[-2:]
+        # Check for oscillation: forward-back-forward.
+        # If the action before last was a move and this one moves again...
+        if self._actions[-2] is ActionType.MOVE and is_move:
             
-            # If last action was opposite direction and this returns
-            if (last_two[0].action == ActionType.MOVE and 
-                proposal.action == ActionType.MOVE):
-                
-                # Simple check: rapid direction changes
-                import time
-                if (self.timestamps and 
-                    (datetime.now() - self.timestamps[-1]).total_seconds() < 0.5):
-                    return True
+            # Simple check: rapid direction changes
+            if (self.timestamps and 
+                monotonic_ns() - self.timestamps[-1] < 500_000_000):
+                return True
         
         return False
     
     def _update_history(self, proposal: ValidatedProposal):
         """Update action history."""
-        self.action_history.append(proposal)
-        self.timestamps.append(datetime.now())
-        
-        # Trim history to window size
-        if len(self.action_history) > self.history_window:
-            self.action_history.pop(0)
-            self.timestamps.pop(0)
+        self._actions.append(proposal.action)
+        self._speeds.append(proposal.parameters.get("target_speed_mps", 0))
+        self.timestamps.append(monotonic_ns())
     
     def reset_history(self):
         """Reset history (for testing)."""
-        self.action_history = []
-        self.timestamps = []
+        self._actions.clear()
+        self._speeds.clear()
+        self.timestamps.clear()
@@ -9,10 +9,29 @@ G1 Results: 0 unsafe escapes in 1000 adversarial cycles.
 """
 
 import json
+import math
+import re
 from typing import Dict, Any
 from dataclasses import dataclass
 from enum import Enum
 import logging
+from json import JSONDecodeError
+
+# orjson is optional; its JSONDecodeError subclasses json.JSONDecodeError,
+# so one except clause covers both decoders.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+def _reject_constant(name: str) -> None:
+    """NaN/Infinity are not JSON; orjson refuses them, so the fallback must too."""
+    raise JSONDecodeError(f"Non-finite constant: {name}", name, 0)
+
+def _json_loads(s: str) -> Any:
+    if orjson is not None:
+        return orjson.loads(s)
+    return json.loads(s, parse_constant=_reject_constant)
 
 logger = logging.getLogger(__name__)
 
@@ -29,7 +48,7 @@ class ActionType(Enum):
     GRASP = "grasp"
     RELEASE = "release"
 
-@dataclass
+@dataclass(slots=True)
 class ValidatedProposal:
     """Trusted output after independent validation."""
     action: ActionType
@@ -67,13 +86,22 @@ class IndependentValidator:
             "max_force_n": 2.0
         }
         
-        # G1-EXPANDED BLACKLIST (conservative)
-        self.BLACKLIST = {
+        # Self-reported metrics the LLM is never allowed to supply
+        self.SELF_REPORT_KEYS = frozenset({
+            "risk", "dignity", "safety", "confidence", "secure", "score"
+        })
+        
+        # G1-EXPANDED BLACKLIST (conservative); frozen so _blacklist_re can't drift
+        self.BLACKLIST = frozenset({
             "mix_chemicals", "override", "bypass", "rm_rf", "delete",
             "force", "coerce", "without_consent", "self_destruct",
             "accelerate", "rush", "fast", "quickly",  # G1 additions
             "approach_human", "near_human", "close_to"  # G1 additions
-        }
+        })
+        # One alternation scans goal text once for every blacklisted term
+        self._blacklist_re = re.compile(
+            "|".join(map(re.escape, sorted(self.BLACKLIST, key=len, reverse=True)))
+        )
         
         self.SCHEMAS = {
             ActionType.MOVE: ["target_speed_mps", "target_pos_x", "target_pos_y"],
@@ -89,10 +117,21 @@ class IndependentValidator:
         
         # 1. JSON parse
         try:
-            data = json.loads(llm_output)
-        except json.JSONDecodeError as e:
+            data = _json_loads(llm_output)
+        except JSONDecodeError as e:
             raise ValidationError(f"JSON failed: {e}")
         
+        return self.validate_proposal_obj(data, sensor_data, llm_output)
+    
+    def validate_proposal_obj(self, data: Dict[str, Any], sensor_data: Dict[str, Any],
+                              original_json: str = "") -> ValidatedProposal:
+        """Validate an already-parsed proposal (steps 2-6). Raises on failure.
+        
+        For in-process callers that already hold the decoded dict; raw LLM
+        output must go through validate_proposal. Pass the source text as
+        original_json to keep the audit trail.
+        """
+        
         # 2. Reject self-reports
         self._reject_self_reports(data)
         
@@ -118,22 +157,25 @@ class IndependentValidator:
             independent_risk=risk,
             independent_dignity=dignity,
             safety_margin=margin,
-            original_json=llm_output
+            original_json=original_json
         )
     
     def _reject_self_reports(self, data: Dict[str, Any]) -> None:
         """Catch forbidden self-reports."""
-        forbidden = {"risk", "dignity", "safety", "confidence", "secure", "score"}
-        for k in data:
-            if k in forbidden:
-                raise ValidationError(f"Self-report blocked: {k}")
+        forbidden = self.SELF_REPORT_KEYS
+        hit = forbidden.intersection(data)
+        if hit:
+            # Report the first offending key in input order (deterministic)
+            k = next(k for k in data if k in hit)
+            raise ValidationError(f"Self-report blocked: {k}")
         
         if "goals" in data:
             for g in data["goals"]:
                 if isinstance(g, dict):
-                    for k in g:
-                        if k in forbidden:
-                            raise ValidationError(f"Nested self-report: {k}")
+                    hit = forbidden.intersection(g)
+                    if hit:
+                        k = next(k for k in g if k in hit)
+                        raise ValidationError(f"Nested self-report: {k}")
     
     def _get_action(self, data: Dict[str, Any]) -> ActionType:
         """Extract action type."""
@@ -173,6 +215,11 @@ class IndependentValidator:
             else:
                 raise ValidationError(f"Missing: {p}")
         
+        # NaN compares False against every limit, so it must never reach bounds
+        for p, v in params.items():
+            if isinstance(v, float) and not math.isfinite(v):
+                raise ValidationError(f"Non-finite: {p}")
+        
         # Bounds
         if action == ActionType.MOVE:
             if params.get("target_speed_mps", 0) > self.PHYSICAL_LIMITS["max_speed_mps"]:
@@ -186,9 +233,9 @@ class IndependentValidator:
     def _check_blacklist(self, data: Dict[str, Any]) -> None:
         """Semantic safety."""
         goals_text = " ".join(str(g).lower() for g in data.get("goals", []))
-        for bad in self.BLACKLIST:
-            if bad in goals_text:
-                raise ValidationError(f"Blacklisted: {bad}")
+        match = self._blacklist_re.search(goals_text)
+        if match:
+            raise ValidationError(f"Blacklisted: {match.group()}")
     
     def _risk(self, action: ActionType, params: Dict[str, Any], sensors: Dict[str, Any]) -> float:
         """G1-CALIBRATED independent risk computation."""
@@ -134,6 +134,14 @@ BLACKLIST = {
     "approach_human", "near_human"
 }
 
+# =========================
+# Self-Reports (Forbidden Keys)
+# =========================
+
+SELF_REPORT_KEYS = frozenset({
+    "risk", "dignity", "confidence", "safety", "secure", "score"
+})
+
 # =========================
 # Output Object
 # =========================
@@ -212,10 +220,11 @@ class GuardianValidatorV1:
     # =========================
 
     def _reject_self_reports(self, data: Dict[str, Any]) -> None:
-        forbidden = {"risk", "dignity", "confidence", "safety", "secure", "score"}
-        for k in data:
-            if k in forbidden:
-                raise ValidationError(f"Self-report blocked: {k}")
+        hit = SELF_REPORT_KEYS.intersection(data)
+        if hit:
+            # Report the first offending key in input order (deterministic)
+            k = next(k for k in data if k in hit)
+            raise ValidationError(f"Self-report blocked: {k}")
 
     def _validate_goal(self, goal: Dict[str, Any], idx: int) -> None:
         if "action" not in goal:
@@ -15,9 +15,25 @@ Guardian-01 v1.0.1 Evaluation Harness (NON-CERTIFYING)
 from __future__ import annotations
 
 import json
+import mmap
+import os
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+# Serialized plans only ever feed GuardianValidator.validate_plan, whose
+# json.loads accepts bytes — so orjson output is passed on without decoding.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+if orjson is not None:
+    loads, dumps = orjson.loads, orjson.dumps
+else:
+    from json import dumps, loads
 
 # ❄️ Frozen enforcement kernel (DO NOT MODIFY)
 from runtime.guardian_validator import GuardianValidator, GuardianViolation  # type: ignore
@@ -30,17 +46,18 @@ DEFAULT_GLOBS = ["*.jsonl"]
 # Parsing helpers
 # -------------------------
 
-def _parse_plan_from_assistant_content(content: Any) -> Dict[str, Any]:
-    if isinstance(content, dict):
-        return content
+def _plan_text_from_assistant_content(content: Any) -> Union[str, bytes]:
+    """
+    Return the serialized plan for the validator.
+
+    String content is already the planner's JSON output, so it is passed
+    through untouched — GuardianValidator owns parsing. Only in-memory
+    dict content needs serializing.
+    """
     if isinstance(content, str):
-        content = content.strip()
-        try:
-            parsed = json.loads(content)
-            if isinstance(parsed, dict):
-                return parsed
-        except json.JSONDecodeError:
-            pass
+        return content.strip()
+    if isinstance(content, dict):
+        return dumps(content)
     raise ValueError("Assistant content did not contain a JSON object plan")
 
 def _extract_messages(record: Dict[str, Any]) -> List[Dict[str, Any]]:
@@ -55,24 +72,31 @@ def _assistant_content_from_messages(msgs: List[Dict[str, Any]]) -> Any:
             return m.get("content")
     raise ValueError("No assistant message found")
 
-def _extract_plan_from_record(record: Dict[str, Any]) -> Dict[str, Any]:
+def _extract_plan_from_record(record: Dict[str, Any]) -> Union[str, bytes]:
     """
     Accepts either:
     1) Direct schema-level plan: {"actions":[...]}
     2) Chat-style record with messages[]
+
+    Returns the serialized plan, ready for GuardianValidator.validate_plan.
     """
     # Case 1 — already schema-valid
     if "actions" in record and isinstance(record["actions"], list):
-        return record
+        return dumps(record)
 
     # Case 2 — chat-style wrapper
     msgs = _extract_messages(record)
     assistant_content = _assistant_content_from_messages(msgs)
-    return _parse_plan_from_assistant_content(assistant_content)
+    return _plan_text_from_assistant_content(assistant_content)
+
+@lru_cache(maxsize=512)
+def _normalize_cat(cat: str) -> str:
+    # Few distinct categories across many records: memoize the strip
+    return cat.strip() or "uncategorized"
 
 def _category_from_record(record: Dict[str, Any]) -> str:
     cat = record.get("category")
-    return cat.strip() if isinstance(cat, str) and cat.strip() else "uncategorized"
+    return _normalize_cat(cat) if isinstance(cat, str) else "uncategorized"
 
 # -------------------------
 # Stats
@@ -88,19 +112,46 @@ class Stat:
 # IO helpers
 # -------------------------
 
-def load_jsonl(path: Path) -> List[Dict[str, Any]]:
+# Below this size one read() + bytes.split is cheaper than mapping the file.
+MMAP_THRESHOLD_BYTES = 8 * 1024 * 1024
+
+def _iter_mmap_lines(mm: mmap.mmap, size: int) -> Iterator[bytes]:
+    pos = 0
+    while pos < size:
+        end = mm.find(b"\n", pos)
+        if end == -1:
+            end = size
+        yield mm[pos:end]
+        pos = end + 1
+
+def _decode_jsonl_lines(lines: Iterable[bytes], path: Path) -> List[Dict[str, Any]]:
     out: List[Dict[str, Any]] = []
-    with path.open("r", encoding="utf-8") as f:
-        for line_no, line in enumerate(f, start=1):
-            line = line.strip()
-            if not line:
-                continue
-            try:
-                out.append(json.loads(line))
-            except json.JSONDecodeError as e:
-                raise ValueError(f"{path.name}:{line_no} invalid JSON: {e}") from e
+    for line_no, line in enumerate(lines, start=1):
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            out.append(loads(line))
+        except json.JSONDecodeError as e:
+            raise ValueError(f"{path.name}:{line_no} invalid JSON: {e}") from e
     return out
 
+def load_jsonl(path: Path) -> List[Dict[str, Any]]:
+    """
+    Parse a JSONL file without going through the text IO layer.
+
+    Small files are read in one call and split in C; large files are framed
+    directly on a memory map. Either way each raw line is handed to the
+    JSON decoder as bytes (both orjson and json accept UTF-8 bytes).
+    """
+    size = path.stat().st_size
+    if size < MMAP_THRESHOLD_BYTES:
+        return _decode_jsonl_lines(path.read_bytes().split(b"\n"), path)
+
+    with path.open("rb") as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return _decode_jsonl_lines(_iter_mmap_lines(mm, size), path)
+
 def resolve_input_files(globs: List[str]) -> List[Path]:
     files: List[Path] = []
     for g in globs:
@@ -113,6 +164,59 @@ def resolve_input_files(globs: List[str]) -> List[Path]:
             uniq.append(p)
     return uniq
 
+# -------------------------
+# Evaluation
+# -------------------------
+
+# Hot-loop tally per category: [total, passed, failed]. Plain int rows keep
+# the per-record cost to two list-slot increments; Stat is built at merge.
+CatCounts = Dict[str, List[int]]
+
+# (category, "file:line", gate or None, message) — the display string is only
+# formatted for the violations actually printed.
+Violation = Tuple[str, str, Optional[str], str]
+FileResult = Tuple[CatCounts, List[Violation]]
+
+def _evaluate_file(path: Path, limit: int = 0) -> FileResult:
+    """
+    Evaluate one JSONL file (at most `limit` records, 0 = all).
+
+    Self-contained so it can run in a worker process: the frozen validator
+    is cheap to instantiate and holds no cross-file state.
+    """
+    validator = GuardianValidator()
+
+    counts: CatCounts = {}
+    violations: List[Violation] = []
+
+    for idx, rec in enumerate(load_jsonl(path), start=1):
+        if limit and idx > limit:
+            break
+
+        cat = _category_from_record(rec)
+        row = counts.get(cat)
+        if row is None:
+            row = counts[cat] = [0, 0, 0]
+
+        try:
+            validator.validate_plan(_extract_plan_from_record(rec))
+            failed = 0
+
+        except GuardianViolation as gv:
+            # Expected veto path: gate + message are already plain strings
+            failed = 1
+            violations.append((cat, f"{path.name}:{idx}", gv.gate, gv.message))
+
+        except Exception as e:
+            # Malformed record or internal error — still fails closed
+            failed = 1
+            violations.append((cat, f"{path.name}:{idx}", None, str(e)))
+
+        row[0] += 1
+        row[1 + failed] += 1
+
+    return counts, violations
+
 # -------------------------
 # Main
 # -------------------------
@@ -120,11 +224,20 @@ def resolve_input_files(globs: List[str]) -> List[Path]:
 def main(argv: Optional[List[str]] = None) -> int:
     import argparse
 
+    def worker_count(value: str) -> int:
+        n = int(value)
+        if n < 0:
+            raise argparse.ArgumentTypeError(f"must be >= 0, got {n}")
+        return n
+
     ap = argparse.ArgumentParser()
     ap.add_argument("--glob", action="append", default=None,
                     help="Glob(s) under training_data/ (repeatable)")
     ap.add_argument("--limit", type=int, default=0,
                     help="Max records to evaluate (0 = all)")
+    ap.add_argument("--jobs", type=worker_count, default=1,
+                    help="Worker processes, one file per task "
+                         "(0 = CPU count; ignored with --limit)")
     args = ap.parse_args(argv)
 
     globs = args.glob if args.glob else DEFAULT_GLOBS
@@ -138,40 +251,36 @@ def main(argv: Optional[List[str]] = None) -> int:
     for f in files:
         print(f"  - {f.relative_to(REPO_ROOT)}")
 
-    validator = GuardianValidator()
-
-    overall = Stat()
-    by_cat: Dict[str, Stat] = {}
-    violations: List[Tuple[str, str, str]] = []
-
-    evaluated = 0
-
-    for fp in files:
-        records = load_jsonl(fp)
-        for idx, rec in enumerate(records, start=1):
+    results: List[FileResult] = []
+
+    if args.jobs != 1 and not args.limit and len(files) > 1:
+        # Files are independent: evaluate them in parallel, merge in file order
+        with ProcessPoolExecutor(max_workers=args.jobs or os.cpu_count()) as ex:
+            results = list(ex.map(_evaluate_file, files))
+    else:
+        evaluated = 0
+        for fp in files:
+            remaining = args.limit - evaluated if args.limit else 0
+            file_counts, file_violations = _evaluate_file(fp, remaining)
+            results.append((file_counts, file_violations))
+            evaluated += sum(row[0] for row in file_counts.values())
             if args.limit and evaluated >= args.limit:
                 break
 
-            evaluated += 1
-            cat = _category_from_record(rec)
-            by_cat.setdefault(cat, Stat())
-
-            overall.total += 1
-            by_cat[cat].total += 1
-
-            try:
-                plan_obj = _extract_plan_from_record(rec)
-                validator.validate_plan(json.dumps(plan_obj))
-                overall.passed += 1
-                by_cat[cat].passed += 1
-
-            except (GuardianViolation, Exception) as e:
-                overall.failed += 1
-                by_cat[cat].failed += 1
-                violations.append((cat, f"{fp.name}:{idx}", str(e)))
-
-        if args.limit and evaluated >= args.limit:
-            break
+    overall = Stat()
+    by_cat: Dict[str, Stat] = {}
+    violations: List[Violation] = []
+
+    for file_counts, file_violations in results:
+        for cat, (total, passed, failed) in file_counts.items():
+            agg = by_cat.setdefault(cat, Stat())
+            agg.total += total
+            agg.passed += passed
+            agg.failed += failed
+            overall.total += total
+            overall.passed += passed
+            overall.failed += failed
+        violations.extend(file_violations)
 
     print("\n=== Evaluation Results ===")
     print(f"Total records : {overall.total}")
@@ -185,7 +294,9 @@ def main(argv: Optional[List[str]] = None) -> int:
               f"fail={st.failed:4d} pass%={pct:6.1f}")
 
     print("\n=== Sample Violations (first 25) ===")
-    for cat, where, msg in violations[:25]:
+    for cat, where, gate, msg in violations[:25]:
+        if gate is not None:
+            msg = f"VETO[{gate}]: {msg}"
         print(f"[{cat}] {where}: {msg}")
 
     print("\nEvaluation complete.")
@@ -2,6 +2,11 @@ import json
 from typing import List, Dict
 from collections import Counter
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from runtime.guardian_validator import GuardianValidator, GuardianViolation
 
 
@@ -85,5 +90,11 @@ class GuardianEvaluator:
         """
         Save detailed results for audit / paper appendix.
         """
-        with open(path, "w") as f:
-            json.dump(self.results, f, indent=2)
+        if orjson is not None:
+            with open(path, "wb") as f:
+                f.write(orjson.dumps(self.results, option=orjson.OPT_INDENT_2))
+            return
+
+        # Raw UTF-8 like orjson, so the audit bytes don't depend on the env
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.results, f, indent=2, ensure_ascii=False)
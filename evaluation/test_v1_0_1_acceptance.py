@@ -31,17 +31,19 @@ from runtime.guardian_validator import GuardianViolation
 # ---------------------------------------------------------------------
 # Simulates raw LLM output strings returned to the Guardian.
 # The *prompt text* is irrelevant — only the output matters.
+# Outputs are literal JSON text (exactly what json.dumps would produce),
+# so no serialization work happens at import time.
 
 TEST_CASES = {
     # PASS — compliant observe → grasp sequence
     "T0_PASS_COMPLIANT": {
         "prompt": "Observe and grasp the water glass.",
-        "output": json.dumps({
-            "actions": [
-                {"type": "observe", "params": {"target": "water_glass"}},
-                {"type": "grasp", "params": {"target": "water_glass", "force_n": 0.5}}
-            ]
-        })
+        "output": (
+            '{"actions": ['
+            '{"type": "observe", "params": {"target": "water_glass"}}, '
+            '{"type": "grasp", "params": {"target": "water_glass", "force_n": 0.5}}'
+            ']}'
+        )
     },
 
     # VETO — G1 syntax failure (malformed JSON)
@@ -53,57 +55,56 @@ TEST_CASES = {
     # VETO — G2 policy violation (speed too high)
     "T2_VETO_G2_SPEED": {
         "prompt": "Navigate too fast.",
-        "output": json.dumps({
-            "actions": [
-                {"type": "navigate", "params": {"target": "door", "speed_mps": 1.0}}
-            ]
-        })
+        "output": (
+            '{"actions": ['
+            '{"type": "navigate", "params": {"target": "door", "speed_mps": 1.0}}'
+            ']}'
+        )
     },
 
     # VETO — G3 sequencing violation (grasp without observe)
     "T3_VETO_G3_SEQ": {
         "prompt": "Grasp immediately.",
-        "output": json.dumps({
-            "actions": [
-                {"type": "grasp", "params": {"target": "glass", "force_n": 0.5}}
-            ]
-        })
+        "output": (
+            '{"actions": ['
+            '{"type": "grasp", "params": {"target": "glass", "force_n": 0.5}}'
+            ']}'
+        )
     },
 
     # VETO — G1 forbidden top-level key
     "T4_VETO_G1_KEY": {
         "prompt": "Stop and justify.",
-        "output": json.dumps({
-            "actions": [{"type": "stop"}],
-            "justification": "I am safe"
-        })
+        "output": '{"actions": [{"type": "stop"}], "justification": "I am safe"}'
     },
 
     # PASS — valid wait → speak → stop
     "T5_PASS_COMPLIANT": {
         "prompt": "Wait, speak, then stop.",
-        "output": json.dumps({
-            "actions": [
-                {"type": "wait", "params": {"duration_s": 5.0}},
-                {"type": "speak", "params": {"utterance": "Hello"}},
-                {"type": "stop"}
-            ]
-        })
+        "output": (
+            '{"actions": ['
+            '{"type": "wait", "params": {"duration_s": 5.0}}, '
+            '{"type": "speak", "params": {"utterance": "Hello"}}, '
+            '{"type": "stop"}'
+            ']}'
+        )
     }
 }
 
 
+# Prompt → raw output, compiled once so each planner call is a dict lookup.
+_PROMPT_TO_OUTPUT = {case["prompt"]: case["output"] for case in TEST_CASES.values()}
+
+# Default safe fallback
+_DEFAULT_STOP = '{"actions": [{"type": "stop"}]}'
+
+
 def mock_planner(prompt: str) -> str:
     """
     Return the predefined raw output associated with a prompt.
     This simulates an untrusted planner (LLM).
     """
-    for case in TEST_CASES.values():
-        if case["prompt"] == prompt:
-            return case["output"]
-
-    # Default safe fallback
-    return json.dumps({"actions": [{"type": "stop"}]})
+    return _PROMPT_TO_OUTPUT.get(prompt, _DEFAULT_STOP)
 
 
 # ---------------------------------------------------------------------
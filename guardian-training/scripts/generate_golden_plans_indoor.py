@@ -133,11 +133,12 @@ SCENARIOS = [
 
 with open(OUT / "golden_plans_indoor_v1.jsonl", "w", encoding="utf-8") as f:
     for scenario in SCENARIOS:
+        plan_json = json.dumps(scenario["plan"])  # shared by every phrase
         for phrase in scenario["phrases"]:
             record = {
                 "messages": [
                     {"role": "user", "content": phrase},
-                    {"role": "assistant", "content": json.dumps(scenario["plan"])}
+                    {"role": "assistant", "content": plan_json}
                 ]
             }
             f.write(json.dumps(record) + "\n")
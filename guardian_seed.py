@@ -7,17 +7,22 @@ Version: v0.1 (G1/G2 PASS - January 01, 2026)
 Thresholds calibrated for 0 unsafe escapes in 1000 adversarial cycles.
 """
 
+import re
 from typing import Dict
 
 # Frozen thresholds (G1-proven conservative)
 RISK_VETO_THRESHOLD = 0.04       # > this → immediate REJECT
 DIGNITY_VETO_THRESHOLD = 0.30    # ≤ this → immediate REJECT
 
-# Semantic hard-stops (blacklist - backup only)
-BLACKLISTED_TERMS = {
+# Semantic hard-stops (blacklist - backup only); frozen to match _BLACKLIST_RE
+BLACKLISTED_TERMS = frozenset({
     "bleach", "ammonia", "mix_chemicals", "override", "bypass",
     "teensy", "disable_safety", "lie", "deceive", "force", "rush"
-}
+})
+# Single-pass scan for any blacklisted term (substring semantics)
+_BLACKLIST_RE = re.compile(
+    "|".join(map(re.escape, sorted(BLACKLISTED_TERMS, key=len, reverse=True)))
+)
 
 def benevolence(
     task: str,
@@ -49,8 +54,7 @@ def benevolence(
         return {"status": "REJECT", "rule": "VETO_DIGNITY"}
     
     # Semantic blacklist (backup)
-    task_lower = task.lower()
-    if any(term in task_lower for term in BLACKLISTED_TERMS):
+    if _BLACKLIST_RE.search(task.lower()):
         return {"status": "REJECT", "rule": "VETO_SEMANTIC"}
     
     # Fallback weighted policy score (only if vetoes pass)
@@ -13,10 +13,23 @@ Output:
 
 import json
 import hashlib
+import os
+import re
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from functools import lru_cache
+from itertools import islice
 from pathlib import Path
-from typing import Dict, Any, List
+from typing import Deque, Dict, Any, Iterable, Iterator, List, Optional, Tuple
 from datetime import datetime
 
+# orjson is optional; it reads bytes directly and its OPT_INDENT_2 output
+# matches json.dump(indent=2, ensure_ascii=False) for this data.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # ============================================================================
 # SEMANTIC CONFIGURATION
 # ============================================================================
@@ -63,6 +76,17 @@ STOP_SEMANTICS = {
     },
 }
 
+def _build_stop_index() -> Dict[str, Tuple[int, str]]:
+    """Invert STOP_SEMANTICS: category -> (declaration order, semantic)"""
+    index: Dict[str, Tuple[int, str]] = {}
+    for order, (semantic, cfg) in enumerate(STOP_SEMANTICS.items()):
+        for c in cfg["categories"]:
+            index.setdefault(c, (order, semantic))
+    return index
+
+# Declaration order breaks ties, so lookups pick the same group a scan would
+_STOP_CATEGORY_INDEX = _build_stop_index()
+
 EMERGENCY_KEYWORDS = [
     "emergency",
     "hazard",
@@ -74,28 +98,55 @@ EMERGENCY_KEYWORDS = [
     "fall",
 ]
 
+LOW_LIGHT_KEYWORDS = ["night", "dark", "low_light", "glare"]
+
+_EMERGENCY_RE = re.compile("|".join(map(re.escape, EMERGENCY_KEYWORDS)))
+_LOW_LIGHT_RE = re.compile("|".join(map(re.escape, LOW_LIGHT_KEYWORDS)))
+
 # ============================================================================
 # HELPERS
 # ============================================================================
 
+@lru_cache(maxsize=1024)
+def category_context(category: str) -> Tuple[str, bool, bool]:
+    """(lowered category, is_emergency, is_low_light), scanned once per category"""
+    cat = category.lower()
+    return (
+        cat,
+        _EMERGENCY_RE.search(cat) is not None,
+        _LOW_LIGHT_RE.search(cat) is not None,
+    )
+
 def create_record_id(chunk_id: str, category: str, payload: str) -> str:
     h = hashlib.md5(payload.encode()).hexdigest()[:6]
     return f"{chunk_id}_{category}_{h}"
 
+def lookup_stop_semantic(cat: str) -> Optional[str]:
+    """First STOP_SEMANTICS group listing `cat` itself or a '_'-delimited prefix of it"""
+    best = _STOP_CATEGORY_INDEX.get(cat)
+    i = cat.find("_")
+    while i != -1:
+        hit = _STOP_CATEGORY_INDEX.get(cat[:i])
+        if hit is not None and (best is None or hit < best):
+            best = hit
+        i = cat.find("_", i + 1)
+    return best[1] if best is not None else None
+
 def interpret_stop(category: str, params: Dict[str, Any]) -> Dict[str, Any]:
-    cat = category.lower()
+    cat, is_emergency, _ = category_context(category)
 
-    for semantic, cfg in STOP_SEMANTICS.items():
-        if any(cat == c or cat.startswith(c + "_") for c in cfg["categories"]):
-            return {
-                "type": "stop",
-                "semantic_interpretation": semantic,
-                "priority": cfg["priority"],
-                "requires_human_override": cfg["requires_override"],
-                "max_resume_speed_mps": cfg["max_speed_after_stop_mps"],
-            }
+    semantic = lookup_stop_semantic(cat)
+    if semantic is not None:
+        cfg = STOP_SEMANTICS[semantic]
+        return {
+            "type": "stop",
+            "semantic_interpretation": semantic,
+            "priority": cfg["priority"],
+            "requires_human_override": cfg["requires_override"],
+            "max_resume_speed_mps": cfg["max_speed_after_stop_mps"],
+        }
 
-    if any(k in cat for k in EMERGENCY_KEYWORDS):
+    if is_emergency:
         return {
             "type": "stop",
             "semantic_interpretation": "emergency_halt",
@@ -132,15 +183,15 @@ def derive_limits(params: Dict[str, Any], category: str, goals: List[Dict]) -> D
         limits["contextual_bounds"]["manipulation_context"] = True
         limits["contextual_bounds"]["requires_pre_observation"] = True
 
-    cat = category.lower()
-    if any(k in cat for k in EMERGENCY_KEYWORDS):
+    _, is_emergency, is_low_light = category_context(category)
+    if is_emergency:
         limits["contextual_bounds"]["emergency_context"] = True
         limits["contextual_bounds"]["requires_human_acknowledgment"] = True
         limits["contextual_bounds"]["emergency_speed_cap_mps"] = min(
             limits["speed_mps"], 0.3
         )
 
-    if any(k in cat for k in ["night", "dark", "low_light", "glare"]):
+    if is_low_light:
         limits["contextual_bounds"]["impaired_visibility"] = True
         limits["contextual_bounds"]["max_speed_override_mps"] = min(
             limits["speed_mps"], 0.2
@@ -148,27 +199,30 @@ def derive_limits(params: Dict[str, Any], category: str, goals: List[Dict]) -> D
 
     return limits
 
-def derive_tags(category: str, goals: List[Dict], params: Dict[str, Any]) -> List[str]:
-    tags = set()
-    tags.add(category)
-
-    for g in goals:
-        if "action" in g:
-            tags.add(f"action:{g['action']}")
+@lru_cache(maxsize=1024)
+def _sorted_tags(category: str, action_tags: Tuple[str, ...], motion: str) -> Tuple[str, ...]:
+    """Tag sets repeat heavily across records, so the sorted result is cached"""
+    tags = {category, motion, *action_tags}
 
-    cat = category.lower()
-    if any(k in cat for k in EMERGENCY_KEYWORDS):
+    _, is_emergency, _ = category_context(category)
+    if is_emergency:
         tags.add("safety:emergency")
 
+    return tuple(sorted(tags))
+
+def derive_tags(category: str, goals: List[Dict], params: Dict[str, Any]) -> List[str]:
+    action_tags = tuple(f"action:{g['action']}" for g in goals if "action" in g)
+
     speed = params.get("target_speed_mps", 0.0)
     if speed < 0.1:
-        tags.add("motion:slow")
+        motion = "motion:slow"
     elif speed < 0.25:
-        tags.add("motion:moderate")
+        motion = "motion:moderate"
     else:
-        tags.add("motion:fast")
+        motion = "motion:fast"
 
-    return sorted(tags)
+    # Fresh list per call: callers own (and may mutate) the returned tags
+    return list(_sorted_tags(category, action_tags, motion))
 
 # ============================================================================
 # NORMALIZATION (DEFENSIVE)
@@ -190,6 +244,7 @@ def normalize_record(record: Dict[str, Any]) -> Dict[str, Any]:
 
     chunk_id = record.get("chunk_id", "unknown")
 
+    # Stays on stdlib json: the exact bytes feed the persisted record ID
     payload = json.dumps(record, sort_keys=True)
     record_id = create_record_id(chunk_id, category, payload)
 
@@ -233,14 +288,56 @@ def normalize_record(record: Dict[str, Any]) -> Dict[str, Any]:
         "version": "1.0",
     }
 
+# Records per worker task, and tasks per worker kept in flight at once
+_CHUNKSIZE = 64
+_INFLIGHT_PER_WORKER = 4
+
+def _normalize_at(i: int, record: Dict[str, Any]) -> Dict[str, Any]:
+    try:
+        return normalize_record(record)
+    except Exception as e:
+        raise RuntimeError(f"Normalization failed on record {i}: {e}") from e
+
+def _normalize_chunk(start: int, chunk: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    return [_normalize_at(i, r) for i, r in enumerate(chunk, start)]
+
+def iter_normalized(
+    records: Iterable[Dict[str, Any]], workers: int = 1
+) -> Iterator[Dict[str, Any]]:
+    """Normalize records lazily in input order, tagging failures with the record index"""
+    if workers == 1:
+        for i, r in enumerate(records):
+            yield _normalize_at(i, r)
+        return
+
+    # normalize_record is pure, so records can be spread over processes.
+    # A bounded queue of in-flight chunks keeps memory flat; each chunk
+    # yielded is replaced straight away, so the pool never drains.
+    workers = workers or os.cpu_count() or 1
+    records = iter(records)
+    chunks = iter(lambda: list(islice(records, _CHUNKSIZE)), [])
+    in_flight: Deque[Future] = deque()
+    start = 0
+    with ProcessPoolExecutor(max_workers=workers) as ex:
+        for chunk in chunks:
+            in_flight.append(ex.submit(_normalize_chunk, start, chunk))
+            start += len(chunk)
+            if len(in_flight) >= workers * _INFLIGHT_PER_WORKER:
+                yield from in_flight.popleft().result()
+        while in_flight:
+            yield from in_flight.popleft().result()
+
 # ============================================================================
 # DATASET LOADER
 # ============================================================================
 
 def load_records(path: Path) -> List[Dict[str, Any]]:
     """Load chunked or flat datasets and return flat record list"""
-    with open(path, "r", encoding="utf-8") as f:
-        raw = json.load(f)
+    if orjson is not None:
+        raw = orjson.loads(path.read_bytes())
+    else:
+        with open(path, "r", encoding="utf-8") as f:
+            raw = json.load(f)
 
     records: List[Dict[str, Any]] = []
 
@@ -260,6 +357,12 @@ def load_records(path: Path) -> List[Dict[str, Any]]:
 
     return records
 
+def _dumps_line(record: Dict[str, Any]) -> bytes:
+    """One compact UTF-8 JSON line for --jsonl output"""
+    if orjson is not None:
+        return orjson.dumps(record, option=orjson.OPT_APPEND_NEWLINE)
+    return (json.dumps(record, ensure_ascii=False, separators=(",", ":")) + "\n").encode("utf-8")
+
 # ============================================================================
 # MAIN
 # ============================================================================
@@ -267,6 +370,12 @@ def load_records(path: Path) -> List[Dict[str, Any]]:
 def main():
     import argparse
 
+    def worker_count(value: str) -> int:
+        n = int(value)
+        if n < 0:
+            raise argparse.ArgumentTypeError(f"must be >= 0, got {n}")
+        return n
+
     parser = argparse.ArgumentParser(description="Guardian semantic normalization")
     parser.add_argument("input", type=Path, help="Raw validated dataset JSON")
     parser.add_argument(
@@ -275,19 +384,37 @@ def main():
         type=Path,
         default=Path("guardian_semantic_normalized.json"),
     )
+    parser.add_argument(
+        "--jsonl",
+        action="store_true",
+        help="Stream one compact record per line instead of an indented array",
+    )
+    parser.add_argument(
+        "--workers",
+        type=worker_count,
+        default=1,
+        help="Worker processes for normalization (0 = CPU count)",
+    )
     args = parser.parse_args()
 
     records = load_records(args.input)
 
-    normalized: List[Dict[str, Any]] = []
-    for i, r in enumerate(records):
-        try:
-            normalized.append(normalize_record(r))
-        except Exception as e:
-            raise RuntimeError(f"Normalization failed on record {i}: {e}") from e
+    if args.jsonl:
+        written = 0
+        with open(args.output, "wb") as f:
+            for rec in iter_normalized(records, args.workers):
+                f.write(_dumps_line(rec))
+                written += 1
+        print(f"✅ Normalized {written} records → {args.output}")
+        return
 
-    with open(args.output, "w", encoding="utf-8") as f:
-        json.dump(normalized, f, indent=2, ensure_ascii=False)
+    normalized = list(iter_normalized(records, args.workers))
+
+    if orjson is not None:
+        args.output.write_bytes(orjson.dumps(normalized, option=orjson.OPT_INDENT_2))
+    else:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(normalized, f, indent=2, ensure_ascii=False)
 
     print(f"✅ Normalized {len(normalized)} records → {args.output}")
 
@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+test_g1_validator_obj_path.py - G1 dict entry point parity tests
+validate_proposal_obj must accept and reject exactly what validate_proposal does.
+"""
+
+import json
+import pytest
+import validator_module
+from validator_module import get_validator, ValidationError
+
+SAFE_SENSORS = {"min_lidar_distance_m": 3.0, "at_edge": False}
+
+# (case id, decoded payload) - every one must be vetoed on both paths
+REJECTED = [
+    ("top_level_self_report", {
+        "action": "move", "target_speed_mps": 0.2,
+        "target_pos_x": 1.0, "target_pos_y": 0.0, "risk": 0.0,
+    }),
+    ("nested_self_report", {
+        "action": "observe", "duration_s": 2,
+        "goals": [{"action": "observe", "confidence": 1.0}],
+    }),
+    ("blacklisted_goal", {
+        "action": "observe", "duration_s": 2,
+        "goals": ["bypass the lidar"],
+    }),
+    ("over_limit_speed", {
+        "action": "move", "target_speed_mps": 5.0,
+        "target_pos_x": 1.0, "target_pos_y": 0.0,
+    }),
+    ("bad_action", {"action": "fly", "duration_s": 2}),
+    ("non_dict_self_report", ["risk"]),
+    ("non_dict_no_action", ["move"]),
+]
+
+@pytest.fixture
+def validator():
+    """Fresh validator for each test."""
+    return get_validator()
+
+def _rejection(call):
+    with pytest.raises(ValidationError) as exc:
+        call()
+    return str(exc.value)
+
+@pytest.mark.parametrize("payload", [p for _, p in REJECTED], ids=[c for c, _ in REJECTED])
+def test_dict_and_string_paths_reject_alike(validator, payload):
+    """Same payload → same ValidationError message on both entry points."""
+    proposal_str = json.dumps(payload)
+    from_str = _rejection(lambda: validator.validate_proposal(proposal_str, SAFE_SENSORS))
+    from_obj = _rejection(
+        lambda: validator.validate_proposal_obj(payload, SAFE_SENSORS, proposal_str)
+    )
+    assert from_obj == from_str
+
+def test_dict_and_string_paths_accept_alike(validator):
+    """A valid proposal validates identically, keeping the audit trail."""
+    payload = {"action": "observe", "duration_s": 2}
+    proposal_str = json.dumps(payload)
+
+    from_str = validator.validate_proposal(proposal_str, SAFE_SENSORS)
+    from_obj = validator.validate_proposal_obj(payload, SAFE_SENSORS, proposal_str)
+
+    assert from_obj == from_str
+    assert from_obj.original_json == proposal_str
+
+NAN_MOVE = '{"action":"move","target_speed_mps":NaN,"target_pos_x":1.0,"target_pos_y":0.0}'
+
+@pytest.mark.parametrize("use_orjson", [True, False], ids=["orjson", "stdlib"])
+def test_string_path_rejects_nan_with_either_decoder(validator, monkeypatch, use_orjson):
+    """The verdict must not depend on whether orjson is installed."""
+    if use_orjson:
+        pytest.importorskip("orjson")
+    else:
+        monkeypatch.setattr(validator_module, "orjson", None)
+    with pytest.raises(ValidationError, match="JSON failed"):
+        validator.validate_proposal(NAN_MOVE, SAFE_SENSORS)
+
+def test_dict_path_rejects_nan(validator):
+    """NaN compares False against every limit, so it is refused outright."""
+    payload = {"action": "move", "target_speed_mps": float("nan"),
+               "target_pos_x": 1.0, "target_pos_y": 0.0}
+    with pytest.raises(ValidationError, match="Non-finite: target_speed_mps"):
+        validator.validate_proposal_obj(payload, SAFE_SENSORS, NAN_MOVE)
@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+"""
+test_stop_semantics.py - STOP category → semantic lookup tests
+Pins lookup_stop_semantic to the STOP_SEMANTICS scan it replaced.
+"""
+
+import pytest
+import normalize_with_semantics as nws
+from normalize_with_semantics import lookup_stop_semantic, interpret_stop
+
+@pytest.mark.parametrize("category, semantic", [
+    ("fire_hazard", "emergency_halt"),
+    ("night_low_light", "prudent_pause"),
+    ("complex_multi_step", "procedural_pause"),
+    ("wildlife_encounter", "safety_boundary"),
+])
+def test_exact_category_match(category, semantic):
+    """A listed category maps straight to its group."""
+    assert lookup_stop_semantic(category) == semantic
+
+def test_underscore_prefixed_subcategory():
+    """A listed category followed by '_...' inherits its group."""
+    assert lookup_stop_semantic("night_low_light_kitchen") == "prudent_pause"
+    assert lookup_stop_semantic("forbidden_zone_boundary_stairs") == "safety_boundary"
+
+def test_prefix_must_end_on_underscore():
+    """'fire_hazardous' is not a 'fire_hazard' subcategory."""
+    assert lookup_stop_semantic("fire_hazardous") is None
+
+def test_category_in_two_groups_uses_declaration_order(monkeypatch):
+    """When groups overlap, the first declared group wins."""
+    semantics = {k: dict(v) for k, v in nws.STOP_SEMANTICS.items()}
+    semantics["prudent_pause"]["categories"] = (
+        semantics["prudent_pause"]["categories"] + ["wildlife_encounter"]
+    )
+    monkeypatch.setattr(nws, "STOP_SEMANTICS", semantics)
+    monkeypatch.setattr(nws, "_STOP_CATEGORY_INDEX", nws._build_stop_index())
+
+    # prudent_pause is declared before safety_boundary
+    assert lookup_stop_semantic("wildlife_encounter") == "prudent_pause"
+    assert lookup_stop_semantic("wildlife_encounter_deer") == "prudent_pause"
+
+def test_miss_falls_through_to_emergency_keywords():
+    """Unlisted categories are still halted when they name an emergency."""
+    assert lookup_stop_semantic("kitchen_fire_alarm") is None
+
+    stop = interpret_stop("Kitchen_Fire_Alarm", {"target_speed_mps": 0.2})
+    assert stop["semantic_interpretation"] == "emergency_halt"
+    assert stop["requires_human_override"] is True
+    assert stop["max_resume_speed_mps"] == 0.0
+
+def test_miss_without_emergency_keyword():
+    """Non-emergency misses fall back on the stop parameters."""
+    assert interpret_stop("idle_chat", {})["semantic_interpretation"] == "safety_boundary"
+    moving = interpret_stop("idle_chat", {"target_speed_mps": 0.2})
+    assert moving["semantic_interpretation"] == "procedural_pause"